@@ -4,15 +4,19 @@ Pomodoro Timer - A beautiful terminal-based pomodoro timer
 with ASCII art, smooth animations, and a modern aesthetic.
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 import time
 import random
 import os
+import threading
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 try:
     import msvcrt  # Windows
@@ -33,12 +37,26 @@ if WINDOWS:
 else:
     HAS_WINSOUND = False
 
-from rich.console import Console, Group
-from rich.live import Live
-from rich.panel import Panel
-from rich.text import Text
-from rich.align import Align
-from rich import box
+# Rich is imported on first use (see _import_rich) so `--help` stays fast
+Console = Group = Live = Panel = Text = Align = Style = box = None
+
+# Shared empty line used as a vertical spacer in the timer layout
+_SPACER = None
+
+
+def _import_rich():
+    """Import the Rich classes used by the timer into the module namespace."""
+    global Console, Group, Live, Panel, Text, Align, Style, box, _SPACER
+    if Console is not None:
+        return
+    from rich.console import Console, Group
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    from rich.style import Style
+    from rich import box
+    _SPACER = Text("")
 
 
 # Motivational quotes for work sessions
@@ -101,9 +119,141 @@ FUN_FACTS = [
 RAIN_CHARS = ["│", "┃", "╽", "╿", "┆", "┇", "┊", "┋"]
 STAR_CHARS = ["✦", "✧", "⋆", "∗", ".", "·", "✶", "✷", "✸", "★", "☆"]
 
+# 7-segment LED display - authentic digital clock style
+# Each digit is 7 lines tall for proper segment proportions
+LED_DIGITS = {
+    '0': [
+        " ████ ",
+        "██  ██",
+        "██  ██",
+        "      ",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+    ],
+    '1': [
+        "    ██",
+        "    ██",
+        "    ██",
+        "      ",
+        "    ██",
+        "    ██",
+        "    ██",
+    ],
+    '2': [
+        " ████ ",
+        "    ██",
+        "    ██",
+        " ████ ",
+        "██    ",
+        "██    ",
+        " ████ ",
+    ],
+    '3': [
+        " ████ ",
+        "    ██",
+        "    ██",
+        " ████ ",
+        "    ██",
+        "    ██",
+        " ████ ",
+    ],
+    '4': [
+        "██  ██",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+        "    ██",
+        "    ██",
+        "    ██",
+    ],
+    '5': [
+        " ████ ",
+        "██    ",
+        "██    ",
+        " ████ ",
+        "    ██",
+        "    ██",
+        " ████ ",
+    ],
+    '6': [
+        " ████ ",
+        "██    ",
+        "██    ",
+        " ████ ",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+    ],
+    '7': [
+        " ████ ",
+        "    ██",
+        "    ██",
+        "      ",
+        "    ██",
+        "    ██",
+        "    ██",
+    ],
+    '8': [
+        " ████ ",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+    ],
+    '9': [
+        " ████ ",
+        "██  ██",
+        "██  ██",
+        " ████ ",
+        "    ██",
+        "    ██",
+        " ████ ",
+    ],
+    ':': [
+        "  ",
+        "██",
+        "  ",
+        "  ",
+        "  ",
+        "██",
+        "  ",
+    ],
+}
+
+# Width of the session progress bar, in cells
+PROGRESS_BAR_WIDTH = 40
+
+# Ambient field cell value for an empty cell
+AMBIENT_BLANK = 255
+
 # Sound types
 SOUND_TYPES = ["bell", "chime", "gong", "arcade", "gentle"]
 
+# Windows alert patterns: (frequency Hz, duration ms, pause after in seconds)
+WINSOUND_PATTERNS = {
+    "bell": [(800, 200, 0.1)] * 3,
+    # Ascending chime: C5, E5, G5
+    "chime": [(523, 200, 0.05), (659, 200, 0.05), (784, 200, 0.05)],
+    # Low resonant gong
+    "gong": [(150, 500, 0.2), (100, 700, 0)],
+    # Fun arcade sound
+    "arcade": [(440, 100, 0), (550, 100, 0), (660, 100, 0), (880, 100, 0), (880, 300, 0)],
+    # Soft gentle tone
+    "gentle": [(440, 300, 0.3), (440, 300, 0)],
+}
+
+# Terminal bell fallback patterns: pause after each bell, in seconds
+BELL_PATTERNS = {
+    "bell": [0.3] * 3,
+    "chime": [0.15] * 4,
+    "gong": [0.8, 0],
+    "arcade": [0.1] * 5,
+    "gentle": [0.5, 0],
+}
+
 
 class SessionType(Enum):
     WORK = "work"
@@ -111,6 +261,54 @@ class SessionType(Enum):
     LONG_BREAK = "long_break"
 
 
+@dataclass(frozen=True)
+class SessionStyle:
+    """Colors, labels, progress bar characters and duration setting for a session type."""
+    color: str
+    accent: str
+    emoji: str
+    name: str
+    mover_pair: tuple[str, str]  # two animation frames for the progress bar mover
+    track_char: str
+    empty_char: str
+    duration_attr: str  # TimerConfig field holding the session length in minutes
+
+
+# Read-only style table, keyed by session type
+SESSION_STYLE = MappingProxyType({
+    SessionType.WORK: SessionStyle(
+        color="#ff6b6b",  # Coral red
+        accent="#fa5252",
+        emoji="🎯",
+        name="FOCUS TIME",
+        mover_pair=("🚂🚃", "🚂🚃"),  # Train with steam animation
+        track_char="═",
+        empty_char="─",
+        duration_attr="work_minutes",
+    ),
+    SessionType.SHORT_BREAK: SessionStyle(
+        color="#51cf66",  # Fresh green
+        accent="#40c057",
+        emoji="☕",
+        name="SHORT BREAK",
+        mover_pair=("🦄✨", "🦄🌟"),  # Unicorn with sparkle animation
+        track_char="~",
+        empty_char="·",
+        duration_attr="short_break_minutes",
+    ),
+    SessionType.LONG_BREAK: SessionStyle(
+        color="#339af0",  # Sky blue
+        accent="#228be6",
+        emoji="🌴",
+        name="LONG BREAK",
+        mover_pair=("🦄✨", "🦄🌟"),  # Unicorn with sparkle animation
+        track_char="~",
+        empty_char="·",
+        duration_attr="long_break_minutes",
+    ),
+})
+
+
 @dataclass
 class TimerConfig:
     work_minutes: int = 25
@@ -134,29 +332,87 @@ class SessionStats:
 
 def load_custom_quotes(filepath: str) -> tuple[list[str], list[str]]:
     """Load custom quotes from a file. Format: one quote per line, '---' separates work/break quotes."""
-    work_quotes = []
-    break_quotes = []
+    if not filepath:
+        return [], []
 
     try:
-        path = Path(filepath)
-        if not path.exists():
-            return [], []
+        with Path(filepath).open('r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return [], []
 
-        content = path.read_text(encoding='utf-8')
-        sections = content.split('---')
+    # Only the first two sections are used; anything after a second '---' is ignored
+    sections = content.split('---', 2)
 
-        if len(sections) >= 1:
-            work_quotes = [q.strip() for q in sections[0].strip().split('\n') if q.strip()]
-        if len(sections) >= 2:
-            break_quotes = [q.strip() for q in sections[1].strip().split('\n') if q.strip()]
+    work_quotes = list(filter(None, map(str.strip, sections[0].splitlines())))
+    break_quotes = []
+    if len(sections) >= 2:
+        break_quotes = list(filter(None, map(str.strip, sections[1].splitlines())))
 
-        return work_quotes, break_quotes
-    except Exception:
-        return [], []
+    return work_quotes, break_quotes
+
+
+def pick_action_key(keys: str) -> str | None:
+    """Pick the control key to act on from a burst of input. Quit wins, otherwise the last control key."""
+    keys = keys.lower()
+    if 'q' in keys:
+        return 'q'
+    for key in reversed(keys):
+        if key in ('p', 'r', 's'):
+            return key
+    return None
+
+
+def _check_key_windows() -> str | None:
+    """Check for keyboard input on Windows (non-blocking)."""
+    # Drain everything typed since the last check
+    keys = []
+    while msvcrt.kbhit():
+        key = msvcrt.getch()
+        try:
+            keys.append(key.decode('utf-8'))
+        except UnicodeDecodeError:
+            continue
+    return pick_action_key(''.join(keys))
+
+
+def _wait_for_key_windows(timeout: float) -> str | None:
+    """Wait up to `timeout` seconds for a key press on Windows."""
+    # msvcrt can't block with a timeout, so poll at 10 Hz
+    key = _check_key_windows()
+    if key is None and timeout > 0:
+        time.sleep(min(timeout, 0.1))
+        key = _check_key_windows()
+    return key
+
+
+def _wait_for_key_unix(timeout: float) -> str | None:
+    """Wait up to `timeout` seconds for a key press on Unix-like systems."""
+    # Block until a key arrives or the timeout expires
+    fd = sys.stdin.fileno()
+    dr, _, _ = select.select([fd], [], [], timeout)
+    if not dr:
+        return None
+
+    # Drain everything that is queued so bursts of keys aren't handled
+    # one per frame
+    buf = b""
+    while dr:
+        chunk = os.read(fd, 32)
+        if not chunk:
+            break
+        buf += chunk
+        dr, _, _ = select.select([fd], [], [], 0)
+    return pick_action_key(buf.decode('utf-8', errors='ignore'))
+
+
+# Resolve the platform once instead of on every poll
+wait_for_key = _wait_for_key_windows if WINDOWS else _wait_for_key_unix
 
 
 class PomodoroTimer:
     def __init__(self, config: TimerConfig):
+        _import_rich()
         self.config = config
         self.console = Console()
         self.current_session = SessionType.WORK
@@ -169,6 +425,15 @@ class PomodoroTimer:
         self.key_pressed = None
         self.stats = SessionStats()
         self.animation_frame = 0
+        self._dirty = True  # display needs a redraw
+        self.wait_for_key = wait_for_key
+        self._alert_lock = threading.Lock()  # held while an alert is playing
+
+        # Private RNG, and shuffled decks so quotes and activities don't repeat
+        # until every entry has been shown, and never twice in a row
+        self._rng = random.Random()
+        self._decks: dict[str, list[str]] = {"work": [], "break": [], "stretch": [], "fun_fact": []}
+        self._last_drawn: dict[str, str] = {}
 
         # Load custom quotes if provided
         self.work_quotes = WORK_QUOTES.copy()
@@ -180,121 +445,183 @@ class PomodoroTimer:
             if custom_break:
                 self.break_quotes = custom_break
 
-        self.stats.current_quote = random.choice(self.work_quotes)
+        self.stats.current_quote = self._draw("work", self.work_quotes)
 
         # Generate ambient animation field (for rain/stars)
-        self.ambient_field = self._generate_ambient_field()
+        self._generate_ambient_field()
 
         # Track previous time for change animation
         self.prev_seconds = -1
         self.time_change_frame = 0
 
-    def _generate_ambient_field(self) -> list[list[str]]:
-        """Generate a field of ambient characters for animation."""
-        width, height = 60, 8
-        field = []
-        for _ in range(height):
-            row = []
-            for _ in range(width):
-                if random.random() < 0.15:  # 15% chance of a character
-                    if self.config.ambient_mode == "rain":
-                        row.append(random.choice(RAIN_CHARS))
-                    elif self.config.ambient_mode == "stars":
-                        row.append(random.choice(STAR_CHARS))
-                    else:
-                        row.append(" ")
-                else:
-                    row.append(" ")
-            field.append(row)
-        return field
+        # Last rendered LED clock face and the (time_str, color) it shows
+        self._last_time_display: tuple[tuple[str, str], Text] | None = None
+
+        # Controls shown in the panel subtitle
+        self._controls_running = Text.from_markup("[dim]P[/dim] pause   [dim]S[/dim] skip   [dim]Q[/dim] quit")
+        self._controls_paused = Text.from_markup("[dim]R[/dim] resume   [dim]S[/dim] skip   [dim]Q[/dim] quit")
+
+        # Colors, labels and progress bar markup for the current session
+        self._session_style = SESSION_STYLE[self.current_session]
+        self.total_seconds = self.remaining_seconds = self.get_session_duration()
+        self._precompute_bar()
+
+        # MM:SS strings for every second of the current session
+        self._precompute_time_strings()
+
+        # Title, quote, activity and stats elements for the current session
+        self._build_static_parts()
+
+    def _draw(self, deck_name: str, source: list[str]) -> str:
+        """Draw the next entry from a shuffled deck, refilling it from `source` when empty."""
+        deck = self._decks[deck_name]
+        if not deck:
+            deck.extend(source)
+            self._rng.shuffle(deck)
+            # Don't start the new round with the entry that ended the last one
+            if len(deck) > 1 and deck[-1] == self._last_drawn.get(deck_name):
+                deck[0], deck[-1] = deck[-1], deck[0]
+        entry = deck.pop()
+        self._last_drawn[deck_name] = entry
+        return entry
+
+    def _generate_ambient_field(self):
+        """Generate a field of ambient characters for animation.
+
+        The field is a flat bytearray of height * width cells, row by row.
+        Each cell is an index into the ambient character set, or
+        AMBIENT_BLANK for an empty cell.
+        """
+        self._ambient_w, self._ambient_h = width, height = 60, 8
+        if self.config.ambient_mode == "rain":
+            self._ambient_chars = RAIN_CHARS
+        elif self.config.ambient_mode == "stars":
+            self._ambient_chars = STAR_CHARS
+        else:
+            self._ambient_chars = []
+
+        # Maps cell bytes (decoded as latin-1) to display characters
+        self._ambient_table = {i: char for i, char in enumerate(self._ambient_chars)}
+        self._ambient_table[AMBIENT_BLANK] = " "
+
+        num_chars = len(self._ambient_chars)
+        rand = self._rng.random
+        randrange = self._rng.randrange
+        # 15% chance of a character
+        self._ambient = bytearray(
+            randrange(num_chars) if num_chars and rand() < 0.15 else AMBIENT_BLANK
+            for _ in range(width * height)
+        )
+
+        # The style is constant, so each row is a styled Text whose plain
+        # text is swapped in place as the field animates
+        if self.config.ambient_mode == "rain":
+            ambient_style = Style(color="#4dabf7", dim=True)  # Light blue for rain
+        else:
+            ambient_style = Style(color="#ffd43b", dim=True)  # Yellow for stars
+        self._ambient_rows = [Text("", style=ambient_style) for _ in range(height)]
+        self._ambient_top = Align.center(Group(self._ambient_rows[0], self._ambient_rows[1]))
+        self._ambient_bottom = Align.center(Group(self._ambient_rows[2], self._ambient_rows[3]))
+        self._refresh_ambient_rows()
 
     def _animate_ambient_field(self):
         """Animate the ambient field."""
         if self.config.ambient_mode == "none":
             return
 
+        field = self._ambient
+        num_chars = len(self._ambient_chars)
+        width = self._ambient_w
+        # Local aliases avoid repeated global/attribute lookups in the loops
+        rand = self._rng.random
+        randrange = self._rng.randrange
+
         if self.config.ambient_mode == "rain":
-            # Rain falls down
-            for col in range(len(self.ambient_field[0])):
-                # Move everything down
-                for row in range(len(self.ambient_field) - 1, 0, -1):
-                    self.ambient_field[row][col] = self.ambient_field[row - 1][col]
-                # New drop at top
-                if random.random() < 0.1:
-                    self.ambient_field[0][col] = random.choice(RAIN_CHARS)
-                else:
-                    self.ambient_field[0][col] = " "
+            # Rain falls down: shift every row down by one in a single move
+            field[width:] = field[:-width]
+            # New drops at top
+            field[:width] = bytes(
+                randrange(num_chars) if rand() < 0.1 else AMBIENT_BLANK
+                for _ in range(width)
+            )
 
         elif self.config.ambient_mode == "stars":
-            # Stars twinkle
-            for row in range(len(self.ambient_field)):
-                for col in range(len(self.ambient_field[0])):
-                    if self.ambient_field[row][col] != " ":
-                        if random.random() < 0.3:  # 30% chance to change
-                            self.ambient_field[row][col] = random.choice(STAR_CHARS)
-                    elif random.random() < 0.02:  # Small chance for new star
-                        self.ambient_field[row][col] = random.choice(STAR_CHARS)
-                    elif random.random() < 0.05:  # Small chance to disappear
-                        if self.ambient_field[row][col] != " ":
-                            self.ambient_field[row][col] = " "
+            # Stars twinkle: draw one roll per cell up front
+            rolls = [rand() for _ in range(len(field))]
+            for i, cell in enumerate(field):
+                roll = rolls[i]
+                if cell != AMBIENT_BLANK:
+                    if roll < 0.3:  # 30% chance to change
+                        field[i] = randrange(num_chars)
+                elif roll < 0.02:  # Small chance for new star
+                    field[i] = randrange(num_chars)
+
+        self._refresh_ambient_rows()
 
     def _render_ambient_line(self, row_idx: int) -> str:
         """Render a single line of the ambient field."""
-        if self.config.ambient_mode == "none" or row_idx >= len(self.ambient_field):
+        if self.config.ambient_mode == "none" or row_idx >= self._ambient_h:
             return ""
 
-        row = self.ambient_field[row_idx]
-        if self.config.ambient_mode == "rain":
-            color = "#4dabf7"  # Light blue for rain
-        else:
-            color = "#ffd43b"  # Yellow for stars
+        start = row_idx * self._ambient_w
+        row = self._ambient[start:start + self._ambient_w]
+        return row.decode('latin-1').translate(self._ambient_table)
 
-        return f"[dim {color}]{''.join(row)}[/dim {color}]"
+    def _refresh_ambient_rows(self):
+        """Copy the ambient field into the pre-styled row Text objects."""
+        for row_idx, row in enumerate(self._ambient_rows):
+            row.plain = self._render_ambient_line(row_idx)
 
-    def get_session_duration(self) -> int:
-        """Get duration in seconds for current session type."""
-        if self.current_session == SessionType.WORK:
-            return self.config.work_minutes * 60
-        elif self.current_session == SessionType.SHORT_BREAK:
-            return self.config.short_break_minutes * 60
-        else:
-            return self.config.long_break_minutes * 60
+    def _build_static_parts(self):
+        """Build the display elements that only change when the session changes."""
+        # Stats line
+        focus_time = self.format_duration(self.stats.total_focus_minutes)
+        stats_line = f"[dim]Today: {self.stats.total_pomodoros_completed} 🍅  •  {focus_time} focused[/dim]"
 
-    def get_session_color(self) -> str:
-        """Get color for current session type."""
-        if self.current_session == SessionType.WORK:
-            return "#ff6b6b"  # Coral red
-        elif self.current_session == SessionType.SHORT_BREAK:
-            return "#51cf66"  # Fresh green
-        else:
-            return "#339af0"  # Sky blue
+        # Quote/tip
+        quote_line = f"[italic dim]{self.stats.current_quote}[/italic dim]"
 
-    def get_session_accent(self) -> str:
-        """Get accent color for current session type."""
-        if self.current_session == SessionType.WORK:
-            return "#fa5252"
-        elif self.current_session == SessionType.SHORT_BREAK:
-            return "#40c057"
-        else:
-            return "#228be6"
+        # Activity line (stretch/fun fact during breaks)
+        activity = None
+        if self.current_session != SessionType.WORK and self.stats.current_activity:
+            activity_line = f"[italic #51cf66]{self.stats.current_activity}[/italic #51cf66]"
+            activity = Align.center(Text.from_markup(activity_line))
+
+        self._static_group_parts = {
+            "title": Text.from_markup("[bold #e599f7]  🍅 POMODORO  [/bold #e599f7]"),
+            "indicators": Align.center(Text.from_markup(self.get_pomodoro_indicators())),
+            "quote": Align.center(Text.from_markup(quote_line)),
+            "activity": activity,
+            "stats": Align.center(Text.from_markup(stats_line)),
+        }
 
-    def get_session_emoji(self) -> str:
-        """Get emoji for current session type."""
-        if self.current_session == SessionType.WORK:
-            return "🎯"
-        elif self.current_session == SessionType.SHORT_BREAK:
-            return "☕"
-        else:
-            return "🌴"
+    def _precompute_bar(self):
+        """Pre-build the progress bar markup on either side of the mover for every fill level."""
+        style = self._session_style
+        color = style.color
+        track_char = style.track_char
+        empty_char = style.empty_char
+
+        self._bar_cache = []
+        for filled in range(PROGRESS_BAR_WIDTH + 1):
+            empty = PROGRESS_BAR_WIDTH - filled
+            if filled == 0:
+                # At the start
+                pre = ""
+                post = f"[dim #555555]{empty_char * empty}[/dim #555555]"
+            elif filled >= PROGRESS_BAR_WIDTH:
+                # Complete
+                pre = f"[{color}]{track_char * (PROGRESS_BAR_WIDTH - 1)}[/{color}]"
+                post = ""
+            else:
+                # In progress - train/unicorn at the front of progress
+                pre = f"[{color}]{track_char * (filled - 1)}[/{color}]"
+                post = f"[dim #555555]{empty_char * empty}[/dim #555555]"
+            self._bar_cache.append((pre, post))
 
-    def get_session_name(self) -> str:
-        """Get display name for current session type."""
-        if self.current_session == SessionType.WORK:
-            return "FOCUS TIME"
-        elif self.current_session == SessionType.SHORT_BREAK:
-            return "SHORT BREAK"
-        else:
-            return "LONG BREAK"
+    def get_session_duration(self) -> int:
+        """Get duration in seconds for current session type."""
+        return getattr(self.config, self._session_style.duration_attr) * 60
 
     def get_pomodoro_indicators(self) -> str:
         """Create visual pomodoro count indicators."""
@@ -318,115 +645,20 @@ class PomodoroTimer:
 
     def format_time(self, seconds: int) -> str:
         """Format seconds as MM:SS."""
-        minutes = seconds // 60
-        secs = seconds % 60
+        minutes, secs = divmod(seconds, 60)
         return f"{minutes:02d}:{secs:02d}"
 
+    def _precompute_time_strings(self):
+        """Pre-format every MM:SS value the current session can show."""
+        self._time_strs = tuple(self.format_time(s) for s in range(self.total_seconds + 1))
+
     def render_time_display(self, time_str: str, color: str) -> Text:
         """Render time as 7-segment LED display (Criminal UK interrogation room style)."""
-        # 7-segment LED display - authentic digital clock style
-        # Each digit is 7 lines tall for proper segment proportions
-        DIGITS = {
-            '0': [
-                " ████ ",
-                "██  ██",
-                "██  ██",
-                "      ",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-            ],
-            '1': [
-                "    ██",
-                "    ██",
-                "    ██",
-                "      ",
-                "    ██",
-                "    ██",
-                "    ██",
-            ],
-            '2': [
-                " ████ ",
-                "    ██",
-                "    ██",
-                " ████ ",
-                "██    ",
-                "██    ",
-                " ████ ",
-            ],
-            '3': [
-                " ████ ",
-                "    ██",
-                "    ██",
-                " ████ ",
-                "    ██",
-                "    ██",
-                " ████ ",
-            ],
-            '4': [
-                "██  ██",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-                "    ██",
-                "    ██",
-                "    ██",
-            ],
-            '5': [
-                " ████ ",
-                "██    ",
-                "██    ",
-                " ████ ",
-                "    ██",
-                "    ██",
-                " ████ ",
-            ],
-            '6': [
-                " ████ ",
-                "██    ",
-                "██    ",
-                " ████ ",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-            ],
-            '7': [
-                " ████ ",
-                "    ██",
-                "    ██",
-                "      ",
-                "    ██",
-                "    ██",
-                "    ██",
-            ],
-            '8': [
-                " ████ ",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-            ],
-            '9': [
-                " ████ ",
-                "██  ██",
-                "██  ██",
-                " ████ ",
-                "    ██",
-                "    ██",
-                " ████ ",
-            ],
-            ':': [
-                "  ",
-                "██",
-                "  ",
-                "  ",
-                "  ",
-                "██",
-                "  ",
-            ],
-        }
+        # The clock only changes once per second, and a countdown never shows
+        # the same time twice, so only the last render is worth keeping
+        key = (time_str, color)
+        if self._last_time_display is not None and self._last_time_display[0] == key:
+            return self._last_time_display[1]
 
         # Build each line of the LED display
         content = Text()
@@ -435,19 +667,20 @@ class PomodoroTimer:
         for line_idx in range(7):
             line_parts = []
             for char in time_str:
-                if char in DIGITS:
-                    line_parts.append(DIGITS[char][line_idx])
+                if char in LED_DIGITS:
+                    line_parts.append(LED_DIGITS[char][line_idx])
                 else:
                     line_parts.append("      ")
 
             line = " ".join(line_parts)
             content.append(f"    {line}\n", style=f"bold {color}")
 
+        self._last_time_display = (key, content)
         return content
 
     def create_display(self) -> Panel:
         """Create the timer display panel."""
-        time_str = self.format_time(self.remaining_seconds)
+        time_str = self._time_strs[self.remaining_seconds]
 
         # Check if time changed for animation
         if self.remaining_seconds != self.prev_seconds:
@@ -457,45 +690,21 @@ class PomodoroTimer:
         # Calculate progress
         progress_pct = ((self.total_seconds - self.remaining_seconds) / self.total_seconds) * 100 if self.total_seconds > 0 else 0
 
-        color = self.get_session_color()
-        accent = self.get_session_accent()
+        style = self._session_style
+        color = style.color
 
         # Fun progress bar with train (work) or unicorn (breaks)
-        bar_width = 40
-        filled = int(bar_width * progress_pct / 100)
-        empty = bar_width - filled
+        filled = int(PROGRESS_BAR_WIDTH * progress_pct / 100)
 
-        # Choose the moving character based on session type
-        if self.current_session == SessionType.WORK:
-            # Train with steam animation
-            steam = ["🚃", "🚃"][self.animation_frame % 2]
-            mover = f"🚂{steam}"
-            track_char = "═"
-            empty_char = "─"
-        else:
-            # Unicorn with sparkle animation
-            sparkle = ["✨", "🌟"][self.animation_frame % 2]
-            mover = f"🦄{sparkle}"
-            track_char = "~"
-            empty_char = "·"
+        # Train (work) or unicorn (breaks), animated between two frames
+        mover = style.mover_pair[self.animation_frame % 2]
 
         # Build the progress bar with the moving character
-        if filled == 0:
-            # At the start
-            progress_bar = f"{mover}[dim #555555]{empty_char * empty}[/dim #555555]"
-        elif filled >= bar_width:
-            # Complete
-            progress_bar = f"[{color}]{track_char * (bar_width - 1)}[/{color}]{mover}"
-        else:
-            # In progress - train/unicorn at the front of progress
-            progress_bar = f"[{color}]{track_char * (filled - 1)}[/{color}]{mover}[dim #555555]{empty_char * empty}[/dim #555555]"
+        bar_pre, bar_post = self._bar_cache[filled]
+        progress_bar = f"{bar_pre}{mover}{bar_post}"
 
         progress_line = f"  {progress_bar}  [bold {color}]{progress_pct:5.1f}%[/bold {color}]"
 
-        # Session info
-        emoji = self.get_session_emoji()
-        session_name = self.get_session_name()
-
         # Build the time display with animation
         content = self.render_time_display(time_str, color)
 
@@ -506,70 +715,48 @@ class PomodoroTimer:
             pulse = pulse_chars[self.animation_frame % 2]
             status_line = f"\n[bold #ffd43b]{pulse} PAUSED[/bold #ffd43b]"
         else:
-            status_line = f"\n[bold {color}]{emoji}  {session_name}[/bold {color}]"
-
-        # Pomodoro progress indicators
-        pomodoro_indicators = self.get_pomodoro_indicators()
-
-        # Stats line
-        focus_time = self.format_duration(self.stats.total_focus_minutes)
-        stats_line = f"[dim]Today: {self.stats.total_pomodoros_completed} 🍅  •  {focus_time} focused[/dim]"
-
-        # Quote/tip
-        quote_line = f"[italic dim]{self.stats.current_quote}[/italic dim]"
-
-        # Activity line (stretch/fun fact during breaks)
-        activity_line = ""
-        if self.current_session != SessionType.WORK and self.stats.current_activity:
-            activity_line = f"[italic #51cf66]{self.stats.current_activity}[/italic #51cf66]"
+            status_line = f"\n[bold {color}]{style.emoji}  {style.name}[/bold {color}]"
 
         # Controls - more minimal and elegant
-        if self.is_paused:
-            controls = "[dim]R[/dim] resume   [dim]S[/dim] skip   [dim]Q[/dim] quit"
-        else:
-            controls = "[dim]P[/dim] pause   [dim]S[/dim] skip   [dim]Q[/dim] quit"
+        controls = self._controls_paused if self.is_paused else self._controls_running
 
-        # Build ambient animation lines
-        ambient_top = ""
-        ambient_bottom = ""
-        if self.config.ambient_mode != "none":
-            ambient_top = self._render_ambient_line(0) + "\n" + self._render_ambient_line(1)
-            ambient_bottom = self._render_ambient_line(2) + "\n" + self._render_ambient_line(3)
+        # Parts that only change between sessions
+        static_parts = self._static_group_parts
 
         # Build the layout with proper spacing
         layout_elements = []
 
         # Add ambient top if enabled
-        if ambient_top:
-            layout_elements.append(Align.center(Text.from_markup(ambient_top)))
+        if self.config.ambient_mode != "none":
+            layout_elements.append(self._ambient_top)
 
         layout_elements.extend([
             Align.center(content),
-            Text(""),
+            _SPACER,
             Align.center(Text.from_markup(progress_line)),
-            Text(""),
+            _SPACER,
             Align.center(Text.from_markup(status_line)),
-            Text(""),
-            Align.center(Text.from_markup(pomodoro_indicators)),
-            Text(""),
-            Align.center(Text.from_markup(quote_line)),
+            _SPACER,
+            static_parts["indicators"],
+            _SPACER,
+            static_parts["quote"],
         ])
 
         # Add activity line for breaks
-        if activity_line:
+        if static_parts["activity"]:
             layout_elements.extend([
-                Text(""),
-                Align.center(Text.from_markup(activity_line)),
+                _SPACER,
+                static_parts["activity"],
             ])
 
         layout_elements.extend([
-            Text(""),
-            Align.center(Text.from_markup(stats_line)),
+            _SPACER,
+            static_parts["stats"],
         ])
 
         # Add ambient bottom if enabled
-        if ambient_bottom:
-            layout_elements.append(Align.center(Text.from_markup(ambient_bottom)))
+        if self.config.ambient_mode != "none":
+            layout_elements.append(self._ambient_bottom)
 
         final_content = Group(*layout_elements)
 
@@ -577,12 +764,12 @@ class PomodoroTimer:
         if self.is_paused:
             border_color = "#ffd43b"
         else:
-            border_color = accent
+            border_color = style.accent
 
         panel = Panel(
             final_content,
-            title=f"[bold #e599f7]  🍅 POMODORO  [/bold #e599f7]",
-            subtitle=Text.from_markup(controls),
+            title=static_parts["title"],
+            subtitle=controls,
             subtitle_align="center",
             border_style=border_color,
             box=box.ROUNDED,
@@ -591,78 +778,39 @@ class PomodoroTimer:
 
         return panel
 
-    def check_key(self) -> str | None:
-        """Check for keyboard input (non-blocking)."""
-        if WINDOWS:
-            if msvcrt.kbhit():
-                key = msvcrt.getch()
-                try:
-                    return key.decode('utf-8').lower()
-                except:
-                    return None
-        else:
-            # Unix-like systems
-            dr, _, _ = select.select([sys.stdin], [], [], 0)
-            if dr:
-                return sys.stdin.read(1).lower()
-        return None
-
     def play_alert(self):
+        """Play the alert sound in the background so the next session starts right away."""
+        # Don't stack alerts if sessions are skipped faster than they play
+        if not self._alert_lock.acquire(blocking=False):
+            return
+        threading.Thread(target=self._play_alert_impl, daemon=True).start()
+
+    def _play_alert_impl(self):
         """Play an alert sound based on configured sound type."""
         sound_type = self.config.sound_type
 
-        if WINDOWS and HAS_WINSOUND:
-            # Use Windows sounds for better audio
-            try:
-                if sound_type == "bell":
-                    for _ in range(3):
-                        winsound.Beep(800, 200)
-                        time.sleep(0.1)
-                elif sound_type == "chime":
-                    # Ascending chime
-                    for freq in [523, 659, 784]:  # C5, E5, G5
-                        winsound.Beep(freq, 200)
-                        time.sleep(0.05)
-                elif sound_type == "gong":
-                    # Low resonant gong
-                    winsound.Beep(150, 500)
-                    time.sleep(0.2)
-                    winsound.Beep(100, 700)
-                elif sound_type == "arcade":
-                    # Fun arcade sound
-                    for freq in [440, 550, 660, 880]:
-                        winsound.Beep(freq, 100)
-                    winsound.Beep(880, 300)
-                elif sound_type == "gentle":
-                    # Soft gentle tone
-                    winsound.Beep(440, 300)
-                    time.sleep(0.3)
-                    winsound.Beep(440, 300)
-                return
-            except Exception:
-                pass  # Fall through to terminal bell
-
-        # Fallback to terminal bell with different patterns
-        if sound_type == "bell":
-            for _ in range(3):
-                print('\a', end='', flush=True)
-                time.sleep(0.3)
-        elif sound_type == "chime":
-            for _ in range(4):
-                print('\a', end='', flush=True)
-                time.sleep(0.15)
-        elif sound_type == "gong":
-            print('\a', end='', flush=True)
-            time.sleep(0.8)
-            print('\a', end='', flush=True)
-        elif sound_type == "arcade":
-            for _ in range(5):
-                print('\a', end='', flush=True)
-                time.sleep(0.1)
-        elif sound_type == "gentle":
-            print('\a', end='', flush=True)
-            time.sleep(0.5)
-            print('\a', end='', flush=True)
+        try:
+            if WINDOWS and HAS_WINSOUND:
+                # Use Windows sounds for better audio
+                try:
+                    for freq, duration, pause in WINSOUND_PATTERNS.get(sound_type, ()):
+                        winsound.Beep(freq, duration)
+                        if pause:
+                            time.sleep(pause)
+                    return
+                except Exception:
+                    pass  # Fall through to terminal bell
+
+            # Fallback to terminal bell with different patterns. Write to the
+            # real stdout: Live redirects sys.stdout, which would repaint the
+            # panel from this thread and strip the bell character.
+            for pause in BELL_PATTERNS.get(sound_type, ()):
+                sys.__stdout__.write('\a')
+                sys.__stdout__.flush()
+                if pause:
+                    time.sleep(pause)
+        finally:
+            self._alert_lock.release()
 
     def next_session(self):
         """Move to the next session."""
@@ -676,67 +824,97 @@ class PomodoroTimer:
                 self.current_session = SessionType.LONG_BREAK
                 self.pomodoro_count = 0
                 # Fun fact for long breaks
-                self.stats.current_activity = random.choice(FUN_FACTS)
+                self.stats.current_activity = self._draw("fun_fact", FUN_FACTS)
             else:
                 self.current_session = SessionType.SHORT_BREAK
                 # Stretch exercise for short breaks
-                self.stats.current_activity = random.choice(STRETCH_EXERCISES)
+                self.stats.current_activity = self._draw("stretch", STRETCH_EXERCISES)
 
             # Switch to break quote
-            self.stats.current_quote = random.choice(self.break_quotes)
+            self.stats.current_quote = self._draw("break", self.break_quotes)
         else:
             self.current_session = SessionType.WORK
             # Switch to work quote
-            self.stats.current_quote = random.choice(self.work_quotes)
+            self.stats.current_quote = self._draw("work", self.work_quotes)
             # Clear activity for work sessions
             self.stats.current_activity = ""
 
+        self._session_style = SESSION_STYLE[self.current_session]
         self.total_seconds = self.get_session_duration()
         self.remaining_seconds = self.total_seconds
+        self._precompute_time_strings()
+        self._precompute_bar()
+        self._build_static_parts()
+        self._dirty = True
 
     def run_session(self, live: Live):
         """Run a single timer session."""
         self.total_seconds = self.get_session_duration()
         self.remaining_seconds = self.total_seconds
-        last_tick = time.time()
-        animation_tick = 0
+        now = time.monotonic()
+        next_tick = now + 1.0
+        next_anim = now + 0.5
+        last_render = now - 1.0
+        self._dirty = True
+        timeout = 0.0
+
+        # Breaks alternate the unicorn's sparkle; the work train is static
+        mover_animates = len(set(self._session_style.mover_pair)) > 1
 
         while self.remaining_seconds > 0 and not self.should_quit:
-            # Check for key presses
-            key = self.check_key()
+            # Sleep until a key press or the next deadline, whichever is first
+            key = self.wait_for_key(timeout)
             if key:
                 if key == 'q':
                     self.should_quit = True
                     break
                 elif key == 'p' and not self.is_paused:
                     self.is_paused = True
+                    self._dirty = True
                 elif key == 'r' and self.is_paused:
                     self.is_paused = False
+                    self._dirty = True
                 elif key == 's':
                     # Skip to next session
                     break
 
+            now = time.monotonic()
+
+            # Only animate when something on screen actually moves: the
+            # pause pulse, the ambient field or the progress bar mover
+            needs_anim = self.is_paused or mover_animates or self.config.ambient_mode != "none"
+
             # Update animation frame for pause pulsing and ambient effects
-            animation_tick += 1
-            if animation_tick >= 5:  # Update animation every 0.5 seconds
+            if needs_anim and now >= next_anim:  # Update animation every 0.5 seconds
                 self.animation_frame += 1
                 self._animate_ambient_field()
                 # Decrement time change animation frame
                 if self.time_change_frame > 0:
                     self.time_change_frame -= 1
-                animation_tick = 0
-
-            # Update display
-            live.update(self.create_display())
-
-            current_time = time.time()
-            if not self.is_paused:
-                if current_time - last_tick >= 1.0:
-                    self.remaining_seconds -= 1
-                    last_tick = current_time
-                time.sleep(0.1)
+                next_anim = now + 0.5
+                self._dirty = True
+
+            if not self.is_paused and now >= next_tick:
+                self.remaining_seconds -= 1
+                next_tick = now + 1.0
+                self._dirty = True
+
+            # Only redraw when something visible changed, with a 1 Hz floor
+            if now - last_render >= 1.0:
+                self._dirty = True
+            if self._dirty:
+                live.update(self.create_display(), refresh=True)
+                self._dirty = False
+                last_render = now
+
+            # Wake exactly when the next tick or animation frame is due
+            if self.is_paused:
+                next_deadline = next_anim
+            elif needs_anim:
+                next_deadline = min(next_tick, next_anim)
             else:
-                time.sleep(0.1)
+                next_deadline = next_tick
+            timeout = max(0.0, next_deadline - time.monotonic())
 
         if not self.should_quit and self.remaining_seconds == 0:
             self.play_alert()
@@ -752,7 +930,8 @@ class PomodoroTimer:
             tty.setcbreak(sys.stdin.fileno())
 
         try:
-            with Live(self.create_display(), console=self.console, refresh_per_second=10, screen=True) as live:
+            # Repaint only when run_session pushes a new frame
+            with Live(self.create_display(), console=self.console, auto_refresh=False, screen=True) as live:
                 while not self.should_quit:
                     self.run_session(live)
 
@@ -855,6 +1034,7 @@ Custom Quotes File Format:
     )
 
     args = parser.parse_args()
+    _import_rich()
 
     config = TimerConfig(
         work_minutes=args.work,